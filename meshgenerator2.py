@@ -3,8 +3,18 @@ import numpy as np
 from collections import defaultdict
 import math
 import os
+from multiprocessing import Pool, shared_memory
 from pathlib import Path          # ← NEW
 
+try:                              # optional: JIT‑compiled OBJ writer
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda fn: fn
+
 # ------------------------------------------------------------------
 # CONFIGURATION
 # ------------------------------------------------------------------
@@ -20,86 +30,422 @@ mesh_out_dir  = SCRIPT_DIR                    # could be another Path
 # ------------------------------------------------------------------
 
 
-def generate_color_atlas(input_path, output_path=atlas_output):
-    """Generate a 1024×1024 texture with all unique colors including partial transparency"""
-    orig_img = Image.open(input_path).convert('RGBA')  # Force RGBA for alpha handling
-    orig_pixels = np.array(orig_img)
+def load_pixels(input_path):
+    """Decode the source image once into an (h, w, 4) RGBA uint8 array"""
+    with Image.open(input_path) as img:
+        # Force RGBA for alpha handling; the PIL copy is dropped right away
+        return np.asarray(img.convert('RGBA'))
+
+
+def unique_visible_colors(orig_pixels, max_palette=1 << 16):
+    """Sorted packed uint32 of every colour with some visibility (alpha > 0)"""
     h, w, _ = orig_pixels.shape
 
-    # Collect all unique colors with some visibility (alpha > 0)
-    unique_colors = {
-        tuple(orig_pixels[y, x])
-        for y in range(h)
-        for x in range(w)
-        if orig_pixels[y, x, 3] > 0     # keep pixels with alpha > 0
-    }
+    # Small palettes: PIL's C hash table (no copy of the pixels) beats sorting
+    img    = Image.frombuffer('RGBA', (w, h), orig_pixels, 'raw', 'RGBA', 0, 1)
+    colors = img.getcolors(maxcolors=max_palette)
+    if colors is not None:
+        rgba = np.array([c for _, c in colors], dtype=np.uint8).reshape(-1, 4)
+        rgba = np.ascontiguousarray(rgba[rgba[:, 3] > 0])
+        return np.sort(rgba.view(np.uint32).reshape(-1))
+
+    # Large palettes: each RGBA pixel is viewed as one uint32 so np.unique
+    # runs in a single pass
+    flat = orig_pixels.reshape(-1, 4)
+    mask = flat[:, 3] > 0   # keep pixels with alpha > 0
+    return np.unique(flat.view(np.uint32).reshape(-1)[mask])
 
-    num_colors = len(unique_colors)
+
+def generate_color_atlas(orig_pixels, output_path=atlas_output):
+    """Generate a 1024×1024 texture with all unique colors including partial transparency"""
+    # The packed uint32 views and PIL's frombuffer need C‑contiguous pixels
+    orig_pixels = np.ascontiguousarray(orig_pixels)
+    uniq_packed = unique_visible_colors(orig_pixels)
+
+    num_colors = len(uniq_packed)
     print(f"Found {num_colors} visible colors")
 
     tex_size   = 1024
     max_colors = tex_size * tex_size
-    unique_colors = list(unique_colors)[:max_colors]  # clamp if needed
 
-    # Grid size
-    cols = math.ceil(math.sqrt(len(unique_colors)))
-    rows = math.ceil(len(unique_colors) / cols)
-
-    if len(unique_colors) == 0:
+    if num_colors == 0:
         raise ValueError("Image has no non‑transparent pixels.")
 
-    # Build the atlas
-    texture     = np.zeros((tex_size, tex_size, 4), dtype=np.uint8)
-    color_to_uv = {}
-    cell_w      = tex_size / cols
-    cell_h      = tex_size / rows
-
-    for i, color in enumerate(unique_colors):
-        col = i % cols
-        row = i // cols
-        x0, x1 = int(col * cell_w),   int((col + 1) * cell_w)
-        y0, y1 = int(row * cell_h),   int((row + 1) * cell_h)
-        texture[y0:y1, x0:x1] = color
-
-        # UV coordinate (centre of the cell)
-        u = (x0 + x1) / (2 * tex_size)
-        v = (y0 + y1) / (2 * tex_size)
-        color_to_uv[color] = (u, v)
-
-    # Fill remaining empty cells with last colour (fully opaque)
-    for i in range(len(unique_colors), cols * rows):
-        col = i % cols
-        row = i // cols
-        x0, x1 = int(col * cell_w), int((col + 1) * cell_w)
-        y0, y1 = int(row * cell_h), int((row + 1) * cell_h)
-        texture[y0:y1, x0:x1] = (*unique_colors[-1][:3], 255)
-
-    Image.fromarray(texture).save(output_path)
+    if num_colors <= max_colors:
+        # One cell per exact colour, found by binary search in uniq_packed
+        cell_colors = uniq_packed.view(np.uint8).reshape(-1, 4)
+        color_keys  = uniq_packed
+        quantized   = False
+    else:
+        # Too many colours for one cell each: bin them to RGB565 plus a coarse
+        # alpha bucket and give every used bin one cell holding the mean of its
+        # colours. color_keys becomes a dense bin → cell table, so lookups need
+        # no search at all.
+        bins              = color_bin(uniq_packed)
+        used_bins, member = np.unique(bins, return_inverse=True)
+        rgba        = uniq_packed.view(np.uint8).reshape(-1, 4)
+        counts      = np.bincount(member)
+        sums        = np.stack([np.bincount(member, rgba[:, k]) for k in range(4)], axis=1)
+        cell_colors = np.rint(sums / counts[:, None]).astype(np.uint8)
+        color_keys  = np.full(COLOR_BINS, len(used_bins), dtype=np.int64)
+        color_keys[used_bins] = np.arange(len(used_bins))
+        quantized   = True
+        print(f"Too many colors for the atlas: quantized to {len(used_bins)} RGB565+alpha colors")
+    n_used = len(cell_colors)
+
+    # Grid size (integer ceil‑sqrt / ceil‑div)
+    cols = math.isqrt(n_used - 1) + 1
+    rows = -(-n_used // cols)
+
+    # Build the atlas: one RGBA entry per cell, padded with the last colour
+    # (fully opaque), then stretched to full size in a single repeat pass
+    n_cells = cols * rows
+    grid    = np.empty((n_cells, 4), dtype=np.uint8)
+    grid[:n_used] = cell_colors
+    grid[n_used:] = (*grid[n_used - 1, :3], 255)
+
+    # Integer cell edges; every pixel of the texture belongs to exactly one cell
+    x_edges = np.arange(cols + 1) * tex_size // cols
+    y_edges = np.arange(rows + 1) * tex_size // rows
+    texture = np.repeat(np.repeat(grid.reshape(rows, cols, 4),
+                                  np.diff(y_edges), axis=0),
+                        np.diff(x_edges), axis=1)
+
+    # UV coordinate (centre of the cell), indexed by cell
+    idx      = np.arange(n_used)
+    cols_arr = idx % cols
+    rows_arr = idx // cols
+    uv_u = ((x_edges[cols_arr] + x_edges[cols_arr + 1]) / (2 * tex_size)).astype(np.float32)
+    uv_v = ((y_edges[rows_arr] + y_edges[rows_arr + 1]) / (2 * tex_size)).astype(np.float32)
+    uv_lut = (color_keys, uv_u, uv_v, quantized)
+
+    # Fastest zlib level: saving the atlas should not cost seconds of compression
+    Image.fromarray(texture).save(output_path, optimize=False, compress_level=1)
     print(f"Color atlas saved to {output_path}")
-    return output_path, color_to_uv, (w, h)
+    return output_path, uv_lut
+
 
+def alpha_summed_area(alpha_mask):
+    """Zero‑padded integral image of the alpha > 0 mask"""
+    h, w = alpha_mask.shape
+    sat  = np.zeros((h + 1, w + 1), dtype=np.int64)
+    sat[1:, 1:] = alpha_mask.cumsum(0).cumsum(1)
+    return sat
 
-def is_tile_fully_transparent(orig_pixels, x0, x1, y0, y1):
+
+def is_tile_fully_transparent(sat, x0, x1, y0, y1):
     """True if every pixel in the tile is alpha == 0"""
-    return np.all(orig_pixels[y0:y1, x0:x1, 3] == 0)
+    return sat[y1, x1] - sat[y0, x1] - sat[y1, x0] + sat[y0, x0] == 0
+
+
+# Quantized atlas: RGB565 × 9 alpha buckets (8 of width 32, plus opaque alone)
+ALPHA_BUCKETS = 9
+COLOR_BINS    = ALPHA_BUCKETS << 16
+
+
+def color_bin(packed):
+    """Quantized bin of each packed RGBA colour: RGB565 plus a coarse alpha bucket"""
+    packed = np.ascontiguousarray(packed)
+    rgba   = packed.view(np.uint8).reshape(-1, 4).astype(np.int64)   # any byte order
+    r, g, b, a = rgba.T
+
+    # Fully opaque colours get their own bucket, so faint colours in the same
+    # RGB565 bin can never lower their alpha
+    a_bucket = np.where(a == 255, ALPHA_BUCKETS - 1, a >> 5)
+    bins = (a_bucket << 16) | ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
+    return bins.reshape(packed.shape)
+
+
+def lookup_colors(color_keys, packed, quantized=False):
+    """Atlas cell of each packed colour (number of cells if absent).
+
+    color_keys is the sorted uniq_packed array, or for a quantized atlas the
+    dense color_bin → cell table.
+    """
+    if quantized:
+        return color_keys[color_bin(packed)]
+    idx   = np.searchsorted(color_keys, packed)
+    found = color_keys[np.minimum(idx, len(color_keys) - 1)] == packed
+    return np.where(found, idx, len(color_keys))
+
+
+def _join_columns(*columns):
+    """Concatenate byte‑string columns (or scalars) element‑wise into one array"""
+    out = np.asarray(columns[0])
+    for col in columns[1:]:
+        out = np.char.add(out, col)
+    return out
+
+
+def merge_runs(color_idx, visible_mask):
+    """Rectangles (c0, r0, c1, r1, colour) covering the visible pixels of a tile.
+
+    Rows are run‑length encoded into same‑colour runs, then runs with the same
+    extent and colour in consecutive rows are stacked into one rectangle.
+    """
+    th, tw = color_idx.shape
+
+    # Horizontal runs: a run starts wherever the colour (or visibility) changes.
+    # Every row starts a run, so a run ends at the next start in flat order.
+    key    = np.where(visible_mask, color_idx, -1)
+    starts = np.ones((th, tw), dtype=bool)
+    starts[:, 1:] = key[:, 1:] != key[:, :-1]
+    bounds = np.flatnonzero(starts)
+    ends   = np.append(bounds[1:], th * tw)
+
+    # Keep only visible runs, selected by mask rather than per‑run tests
+    shown  = visible_mask.reshape(-1)[bounds]
+    r0, c0 = np.divmod(bounds[shown], tw)
+    c1     = ends[shown] - r0 * tw
+    color  = key[r0, c0]
+
+    # Vertical merge: a run continues the run starting at the same column in
+    # the row above if both have the same end and colour
+    n        = len(r0)
+    start_id = np.full((th + 1, tw), -1)
+    start_id[r0 + 1, c0] = np.arange(n)
+    prev     = start_id[r0, c0]
+    merge_up = (prev >= 0) & (c1[prev] == c1) & (color[prev] == color)
+    head     = np.where(merge_up, prev, np.arange(n))
+    while True:                                      # pointer jumping to the top run
+        nxt = head[head]
+        if np.array_equal(nxt, head):
+            break
+        head = nxt
+    r1 = r0 + 1
+    np.maximum.at(r1, head, r0 + 1)
+    top = ~merge_up
+    return c0[top], r0[top], c1[top], r1[top], color[top]
+
+
+def tile_quads(x0, y0, orig_h, color_idx, visible_mask):
+    """Vertices and quads for one tile: (vx, vy, faces, face_uv, tile_colors).
+
+    faces holds 1‑based vertex ids, corners ordered like the original per‑pixel
+    quad (top‑left, top‑right, bottom‑right, bottom‑left). tile_colors are the
+    atlas colours used by the tile (one "vt" each) and face_uv the 1‑based
+    "vt" id of every quad.
+    """
+    tw = color_idx.shape[1]
+    c0, r0, c1, r1, face_color = merge_runs(color_idx, visible_mask)
+
+    # Only the grid corners actually used by a quad become vertices
+    corners = np.stack([r0 * (tw + 1) + c0, r0 * (tw + 1) + c1,
+                        r1 * (tw + 1) + c1, r1 * (tw + 1) + c0], axis=1)
+    used, faces = np.unique(corners, return_inverse=True)
+    faces = faces.reshape(-1, 4) + 1
+
+    # Atlas cells are solid, so every quad of a colour can share one UV
+    tile_colors, face_uv = np.unique(face_color, return_inverse=True)
+
+    # Flip Y
+    vy, vx = np.divmod(used, tw + 1)
+    return x0 + vx, orig_h - (y0 + vy), faces, face_uv + 1, tile_colors
+
+
+# OBJ lines formatted per block: small enough that a block's text and the
+# arrays it is built from stay cache‑resident until it is written out
+EMIT_BLOCK = 2048
+
+
+def _tile_obj_numpy(vx, vy, faces, face_uv, tile_colors, uv_lines, int_text):
+    """Yield the OBJ body of one tile in blocks of EMIT_BLOCK lines (no Numba).
+
+    int_text[i] is the ASCII form of i, so numbers are gathered, not formatted.
+    """
+    for i in range(0, len(vx), EMIT_BLOCK):
+        bx, by = vx[i:i + EMIT_BLOCK], vy[i:i + EMIT_BLOCK]
+        yield b"".join(_join_columns(b"v ", int_text[bx], b" ", int_text[by], b" 0\n").tolist())
+
+    # One UV per colour in the tile, shared by all of its quads
+    for i in range(0, len(tile_colors), EMIT_BLOCK):
+        yield b"".join(uv_lines[tile_colors[i:i + EMIT_BLOCK]].tolist())
+
+    for i in range(0, len(faces), EMIT_BLOCK):
+        a, b, c, d = int_text[faces[i:i + EMIT_BLOCK]].T
+        t = int_text[face_uv[i:i + EMIT_BLOCK]]
+        yield b"".join(_join_columns(b"f ", a, b"/", t, b" ", b, b"/", t, b" ",
+                                     c, b"/", t, b" ", d, b"/", t, b"\n").tolist())
+
+
+@njit(cache=True)
+def _int_len(n):
+    """Number of decimal digits in a non‑negative int"""
+    length = 1
+    while n >= 10:
+        n //= 10
+        length += 1
+    return length
+
+
+@njit(cache=True)
+def _put_int(buf, pos, n):
+    """Write n as ASCII digits at buf[pos:], return the new position"""
+    end = pos + _int_len(n)
+    i = end
+    while True:
+        i -= 1
+        buf[i] = 48 + n % 10
+        n //= 10
+        if n == 0:
+            return end
+
+
+@njit(cache=True)
+def _put_vertex(buf, pos, x, y):
+    """Write one "v x y 0" line at buf[pos:], return the new position"""
+    buf[pos] = 118       # 'v'
+    buf[pos + 1] = 32
+    pos = _put_int(buf, pos + 2, x)
+    buf[pos] = 32
+    pos = _put_int(buf, pos + 1, y)
+    buf[pos] = 32
+    buf[pos + 1] = 48    # '0'
+    buf[pos + 2] = 10
+    return pos + 3
+
+
+@njit(cache=True)
+def _emit_obj_block(vx, vy, faces, face_uv, tile_colors, uv_bytes, uv_len, out, lo, hi):
+    """Write OBJ lines lo..hi‑1 (all v, then vt, then f) into out; return the byte count.
+
+    Lines are written back to back in a single pass over the geometry, so no
+    separate pass is needed to size them first.
+    """
+    nv, nt = len(vx), len(tile_colors)
+    pos = 0
+    for k in range(lo, min(hi, nv)):
+        pos = _put_vertex(out, pos, vx[k], vy[k])
+
+    # One UV per colour in the tile, shared by all of its quads
+    for k in range(max(lo, nv), min(hi, nv + nt)):
+        c = tile_colors[k - nv]
+        for i in range(uv_len[c]):
+            out[pos + i] = uv_bytes[c, i]
+        pos += uv_len[c]
+
+    for k in range(max(lo, nv + nt), hi):
+        i = k - nv - nt
+        out[pos] = 102   # 'f'
+        pos += 1
+        for j in range(4):
+            out[pos] = 32
+            pos = _put_int(out, pos + 1, faces[i, j])
+            out[pos] = 47    # '/'
+            pos = _put_int(out, pos + 1, face_uv[i])
+        out[pos] = 10
+        pos += 1
+    return pos
+
+
+def _tile_obj_numba(vx, vy, faces, face_uv, tile_colors, uv_bytes, uv_len):
+    """Yield the OBJ body of one tile in blocks of EMIT_BLOCK lines (JIT kernel)"""
+    n_lines = len(vx) + len(tile_colors) + len(faces)
+
+    # One buffer, sized for EMIT_BLOCK of the longest possible line, is reused
+    digits   = len(str(max(vx.max(initial=0), vy.max(initial=0),
+                           faces.max(initial=0), face_uv.max(initial=0))))
+    max_line = max(6 + 2 * digits, uv_bytes.shape[1], 10 + 8 * digits)
+    out      = np.empty(EMIT_BLOCK * max_line, dtype=np.uint8)
+    for lo in range(0, n_lines, EMIT_BLOCK):
+        n = _emit_obj_block(vx, vy, faces, face_uv, tile_colors, uv_bytes, uv_len,
+                            out, lo, min(lo + EMIT_BLOCK, n_lines))
+        yield out[:n].tobytes()
 
 
-def create_tiled_meshes(input_path, color_atlas_path, color_to_uv, original_dims,
-                        max_tris=10000):
-    """Create mesh tiles, skipping only 100 % transparent tiles"""
-    orig_w, orig_h = original_dims
-    orig_pixels    = np.array(Image.open(input_path).convert('RGBA'))
+# ------------------------------------------------------------------
+# TILE WORKERS
+# ------------------------------------------------------------------
+# Per‑process state set by _init_worker; read‑only while tiles are emitted
+_worker = {}
+
+
+def _share_array(arr):
+    """Copy arr into a new SharedMemory block → (block, spec for _attach_array)"""
+    shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+    np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[...] = arr
+    return shm, (shm.name, arr.shape, arr.dtype.str)
+
+
+def _attach_array(spec):
+    """Map a block created by _share_array → (block, array view)"""
+    name, shape, dtype = spec
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype, buffer=shm.buf)
+
+
+def _set_worker_state(orig_pixels, alpha_mask, color_keys, uv_lines, int_text, quantized,
+                      orig_h, out_dir):
+    _worker.update(orig_pixels=orig_pixels, alpha_mask=alpha_mask, color_keys=color_keys,
+                   uv_lines=uv_lines, int_text=int_text, quantized=quantized,
+                   orig_h=orig_h, out_dir=out_dir)
+    if HAVE_NUMBA:
+        # Same lines as a padded byte table for the JIT kernel
+        uv_bytes = np.frombuffer(uv_lines.tobytes(), dtype=np.uint8)
+        _worker["uv_bytes"] = uv_bytes.reshape(len(uv_lines), -1)
+        _worker["uv_len"]   = np.char.str_len(uv_lines).astype(np.int64)
+
+
+def _init_worker(specs, quantized, orig_h, out_dir):
+    """Pool initializer: attach the shared arrays once per process"""
+    blocks, arrays = zip(*(_attach_array(spec) for spec in specs))
+    _worker["blocks"] = blocks                        # keep the mappings alive
+    _set_worker_state(*arrays, quantized, orig_h, out_dir)
+
+
+def _emit_tile(args):
+    """Write one tile's OBJ file and return its path"""
+    tx, ty, x0, x1, y0, y1 = args
+    w = _worker
+
+    tile      = np.ascontiguousarray(w["orig_pixels"][y0:y1, x0:x1])
+    color_idx = lookup_colors(w["color_keys"], tile.view(np.uint32)[..., 0], w["quantized"])
+    visible   = w["alpha_mask"][y0:y1, x0:x1]
+    quads     = tile_quads(x0, y0, w["orig_h"], color_idx, visible)
+    if HAVE_NUMBA:
+        blocks = _tile_obj_numba(*quads, w["uv_bytes"], w["uv_len"])
+    else:
+        blocks = _tile_obj_numpy(*quads, w["uv_lines"], w["int_text"])
+
+    # Each block is written as soon as it is formatted
+    mesh_path = w["out_dir"] / f"pixel_mesh_{tx}_{ty}.obj"
+    with mesh_path.open('wb') as f:
+        f.write(f"# Tile {tx}, {ty}\n".encode("ascii"))
+        for block in blocks:
+            f.write(block)
+    return mesh_path
+
+
+def create_tiled_meshes(orig_pixels, color_atlas_path, uv_lut,
+                        max_tris=10000, workers=None):
+    """Create mesh tiles, skipping only 100 % transparent tiles.
+
+    Tiles are written by a pool of `workers` processes (default: one per CPU).
+    """
+    orig_pixels    = np.ascontiguousarray(orig_pixels)   # views below need C order
+    orig_h, orig_w = orig_pixels.shape[:2]
+    alpha_mask     = orig_pixels[..., 3] > 0
+    sat            = alpha_summed_area(alpha_mask)
+
+    # One "vt" line per atlas colour, plus a trailing (0, 0) entry for misses
+    color_keys, uv_u, uv_v, quantized = uv_lut
+    uv_lines = np.array([f"vt {u} {1 - v}\n".encode("ascii")
+                         for u, v in zip(uv_u.tolist(), uv_v.tolist())] + [b"vt 0.0 1.0\n"])
 
     # Pixels per mesh ⇒ triangles per mesh
     max_pixels_per_mesh = max_tris // 2
     cols_per_mesh       = min(orig_w, math.isqrt(max_pixels_per_mesh))
     rows_per_mesh       = min(orig_h, max_pixels_per_mesh // cols_per_mesh)
 
-    tiles_x = math.ceil(orig_w / cols_per_mesh)
-    tiles_y = math.ceil(orig_h / rows_per_mesh)
+    # ASCII for every integer a tile can write: coordinates and vertex/UV ids
+    max_int  = max(orig_w, orig_h, (cols_per_mesh + 1) * (rows_per_mesh + 1)) + 1
+    int_text = np.array([str(i).encode("ascii") for i in range(max_int + 1)])
+
+    tiles_x = -(-orig_w // cols_per_mesh)
+    tiles_y = -(-orig_h // rows_per_mesh)
     print(f"Splitting into {tiles_x} × {tiles_y} tiles")
 
-    mesh_paths, skipped = [], 0
+    tile_args, skipped = [], 0
     for ty in range(tiles_y):
         for tx in range(tiles_x):
             x0 = tx * cols_per_mesh
@@ -107,37 +453,32 @@ def create_tiled_meshes(input_path, color_atlas_path, color_to_uv, original_dims
             y0 = ty * rows_per_mesh
             y1 = min((ty + 1) * rows_per_mesh, orig_h)
 
-            if is_tile_fully_transparent(orig_pixels, x0, x1, y0, y1):
+            if is_tile_fully_transparent(sat, x0, x1, y0, y1):
                 skipped += 1
                 continue
-
-            mesh_path = mesh_out_dir / f"pixel_mesh_{tx}_{ty}.obj"
-            mesh_paths.append(mesh_path)
-
-            with mesh_path.open('w') as f:
-                f.write(f"# Tile {tx}, {ty}\n")
-                v_idx = uv_idx = 1
-
-                for y in range(y0, y1):
-                    for x in range(x0, x1):
-                        color = tuple(orig_pixels[y, x])
-
-                        # Quad vertices (flip Y)
-                        f.write(f"v {x} {orig_h - y} 0\n")
-                        f.write(f"v {x+1} {orig_h - y} 0\n")
-                        f.write(f"v {x+1} {orig_h - y - 1} 0\n")
-                        f.write(f"v {x} {orig_h - y - 1} 0\n")
-
-                        # Same UV for all 4 vertices
-                        u, v = color_to_uv.get(color, (0.0, 0.0))
-                        for _ in range(4):
-                            f.write(f"vt {u} {1 - v}\n")
-
-                        if color[3] > 0:  # non‑transparent
-                            f.write(f"f {v_idx}/{uv_idx} {v_idx+1}/{uv_idx+1} "
-                                    f"{v_idx+2}/{uv_idx+2} {v_idx+3}/{uv_idx+3}\n")
-                        v_idx += 4
-                        uv_idx += 4
+            tile_args.append((tx, ty, x0, x1, y0, y1))
+
+    workers = min(workers or os.cpu_count() or 1, len(tile_args))
+    if workers <= 1:
+        _set_worker_state(orig_pixels, alpha_mask, color_keys, uv_lines, int_text, quantized,
+                          orig_h, mesh_out_dir)
+        try:
+            mesh_paths = [_emit_tile(args) for args in tile_args]
+        finally:
+            _worker.clear()                           # don't pin the image after return
+    else:
+        # Workers map the big arrays instead of receiving a pickled copy each
+        shared = [_share_array(a) for a in (orig_pixels, alpha_mask, color_keys, uv_lines,
+                                            int_text)]
+        try:
+            initargs = ([spec for _, spec in shared], quantized, orig_h, mesh_out_dir)
+            with Pool(workers, _init_worker, initargs) as pool:
+                mesh_paths = pool.map(_emit_tile, tile_args,
+                                      chunksize=max(1, len(tile_args) // (4 * workers)))
+        finally:
+            for shm, _ in shared:
+                shm.close()
+                shm.unlink()
 
     print(f"Generated {len(mesh_paths)} mesh tiles (skipped {skipped} fully transparent tiles)")
     return mesh_paths
@@ -147,10 +488,12 @@ def create_tiled_meshes(input_path, color_atlas_path, color_to_uv, original_dims
 # MAIN
 # ------------------------------------------------------------------
 if __name__ == "__main__":
+    orig_pixels = load_pixels(input_image)
+
     print("Generating color atlas …")
-    atlas_path, uv_map, orig_dims = generate_color_atlas(input_image)
+    atlas_path, uv_lut = generate_color_atlas(orig_pixels)
 
     print("Creating mesh tiles …")
-    mesh_files = create_tiled_meshes(input_image, atlas_path, uv_map, orig_dims)
+    mesh_files = create_tiled_meshes(orig_pixels, atlas_path, uv_lut)
 
     print(f"Process complete! Created {len(mesh_files)} mesh files.")